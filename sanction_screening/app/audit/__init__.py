@@ -1,6 +1,6 @@
 """Audit and compliance logging module"""
 from .logger import AuditLogger, audit_logger
 from .models import LogEntry, MatchEntry
-from .storage import AuditStorage
+from .storage import AuditStorage, ParquetAuditStorage
 
-__all__ = ['AuditLogger', 'audit_logger', 'LogEntry', 'MatchEntry', 'AuditStorage']
\ No newline at end of file
+__all__ = ['AuditLogger', 'audit_logger', 'LogEntry', 'MatchEntry', 'AuditStorage', 'ParquetAuditStorage']
\ No newline at end of file
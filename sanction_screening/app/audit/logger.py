@@ -1,6 +1,6 @@
 """Main audit logger for SLST compliance tracking"""
+import time
 import uuid
-from datetime import datetime
 from typing import Dict, List, Optional, Any
 from .models import LogEntry, MatchEntry
 from .storage import AuditStorage
@@ -18,11 +18,15 @@ class AuditLogger:
         processing_time_ms: float,
         user_id: Optional[str] = None,
         session_id: Optional[str] = None,
-        source_ip: Optional[str] = None
+        source_ip: Optional[str] = None,
+        screening_id: Optional[str] = None
     ) -> str:
-        """Log a screening event and return screening_id"""
-        
-        screening_id = str(uuid.uuid4())
+        """Log a screening event and return screening_id
+
+        Callers that log in the background can pre-generate the id and
+        pass it in so their response doesn't wait on the logger.
+        """
+        screening_id = screening_id or str(uuid.uuid4())
         
         # Extract key information from screening result
         decision = screening_result.get('decision', {}).get('action', 'UNKNOWN')
@@ -32,7 +36,7 @@ class AuditLogger:
         # Create main log entry
         log_entry = LogEntry(
             screening_id=screening_id,
-            timestamp=datetime.now(),
+            timestamp=time.time_ns(),
             event_type='SCREENING',
             query=query,
             decision=decision,
@@ -44,14 +48,63 @@ class AuditLogger:
             source_ip=source_ip
         )
         
-        # Log the screening event
-        self.storage.log_screening(log_entry)
-        
-        # Log match details if any
-        if matches:
-            match_entries = []
-            for match in matches:
-                match_entry = MatchEntry(
+        # Build match detail entries if any
+        match_entries = [
+            MatchEntry(
+                screening_id=screening_id,
+                target_name=match.get('target_name', ''),
+                source=match.get('source', ''),
+                match_score=match.get('score', 0.0),
+                risk_score=match.get('risk_score', 0.0),
+                match_type=match.get('match_type', 'unknown')
+            )
+            for match in matches
+        ]
+
+        # Log event and match details together (one write per file)
+        self.storage.log_bundle(log_entry, match_entries)
+
+        return screening_id
+    
+    def log_screening_batch(
+        self,
+        records: List[tuple],
+        user_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        screening_ids: Optional[List[str]] = None
+    ) -> List[str]:
+        """Log many screening events with one storage write per file
+
+        records is a list of (query, screening_result, processing_time_ms)
+        tuples. Returns the screening_ids in record order; pre-generated
+        ids can be supplied for background logging.
+        """
+        timestamp = time.time_ns()
+        if screening_ids is None:
+            screening_ids = [str(uuid.uuid4()) for _ in records]
+        log_entries = []
+        match_entries = []
+
+        for (query, screening_result, processing_time_ms), screening_id in zip(records, screening_ids):
+
+            decision = screening_result.get('decision', {}).get('action', 'UNKNOWN')
+            risk_level = screening_result.get('summary', {}).get('highest_risk', 'NONE')
+            matches = screening_result.get('matches', [])
+
+            log_entries.append(LogEntry(
+                screening_id=screening_id,
+                timestamp=timestamp,
+                event_type='SCREENING',
+                query=query,
+                decision=decision,
+                risk_level=risk_level,
+                matches_count=len(matches),
+                processing_time_ms=processing_time_ms,
+                user_id=user_id,
+                session_id=session_id
+            ))
+            match_entries.extend(
+                MatchEntry(
                     screening_id=screening_id,
                     target_name=match.get('target_name', ''),
                     source=match.get('source', ''),
@@ -59,12 +112,15 @@ class AuditLogger:
                     risk_score=match.get('risk_score', 0.0),
                     match_type=match.get('match_type', 'unknown')
                 )
-                match_entries.append(match_entry)
-            
+                for match in matches
+            )
+
+        self.storage.log_screenings(log_entries)
+        if match_entries:
             self.storage.log_matches(match_entries)
-        
-        return screening_id
-    
+
+        return screening_ids
+
     def log_batch_screening(
         self,
         batch_id: str,
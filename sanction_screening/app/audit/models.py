@@ -1,14 +1,14 @@
 """Audit data models for compliance logging"""
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 import uuid
 
-@dataclass
+@dataclass(slots=True)
 class LogEntry:
     """Single audit log entry for screening event"""
     screening_id: str
-    timestamp: datetime
+    timestamp: int  # nanoseconds since epoch (time.time_ns())
     event_type: str  # 'SCREENING', 'BATCH_SCREENING', 'SYSTEM_EVENT'
     query: str
     decision: str  # 'BLOCK', 'ESCALATE', 'MANUAL_REVIEW', 'AUTO_CLEAR'
@@ -21,21 +21,16 @@ class LogEntry:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
-        return {
-            'screening_id': self.screening_id,
-            'timestamp': self.timestamp.isoformat(),
-            'event_type': self.event_type,
-            'query': self.query,
-            'decision': self.decision,
-            'risk_level': self.risk_level,
-            'matches_count': self.matches_count,
-            'processing_time_ms': self.processing_time_ms,
-            'user_id': self.user_id,
-            'session_id': self.session_id,
-            'source_ip': self.source_ip
-        }
+        data = asdict(self)
+        # ISO formatting is deferred to here so the capture on the
+        # screening path is just a cheap time.time_ns() call
+        timestamp = data['timestamp']
+        if not isinstance(timestamp, datetime):
+            timestamp = datetime.fromtimestamp(timestamp / 1e9)
+        data['timestamp'] = timestamp.isoformat()
+        return data
 
-@dataclass
+@dataclass(slots=True)
 class MatchEntry:
     """Audit entry for individual match details"""
     screening_id: str
@@ -46,11 +41,4 @@ class MatchEntry:
     match_type: str  # 'exact', 'fuzzy', 'partial'
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'screening_id': self.screening_id,
-            'target_name': self.target_name,
-            'source': self.source,
-            'match_score': self.match_score,
-            'risk_score': self.risk_score,
-            'match_type': self.match_type
-        }
\ No newline at end of file
+        return asdict(self)
\ No newline at end of file
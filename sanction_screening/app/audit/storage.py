@@ -1,32 +1,177 @@
 """File-based audit storage for compliance records"""
+import atexit
 import json
 import os
+import queue
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any
 from .models import LogEntry, MatchEntry
+from ..config import settings
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+# How often the background flusher pushes buffered writes to disk
+FLUSH_INTERVAL_SECONDS = 5.0
+
+# Bounded queue: put() blocks the caller under overload (backpressure)
+QUEUE_MAX_EVENTS = 10_000
+
+# Max events drained per batch by the writer thread
+BATCH_MAX_EVENTS = 256
+
+# writev is POSIX-only; fall back to a joined write elsewhere
+_HAS_WRITEV = hasattr(os, 'writev')
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize one audit record to JSON bytes (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, default=str).encode('utf-8')
+
+def _writev_all(fd: int, payloads: List[bytes]) -> None:
+    """writev until every buffer is fully written
+
+    writev may write fewer bytes than requested (signal interruption,
+    filesystem limits); stopping there would tear a JSONL record
+    mid-line and drop the rest of the batch. Retry from the returned
+    byte count until all buffers are consumed.
+    """
+    remaining = list(payloads)
+    while remaining:
+        written = os.writev(fd, remaining)
+        while remaining and written >= len(remaining[0]):
+            written -= len(remaining[0])
+            remaining.pop(0)
+        if written:
+            remaining[0] = remaining[0][written:]
+
+class _AuditWriter(threading.Thread):
+    """Daemon thread that batches queued audit payloads into file writes"""
+
+    def __init__(self, files: Dict[Path, Any], lock: threading.Lock,
+                 work_queue: "queue.Queue"):
+        super().__init__(daemon=True, name='audit-writer')
+        self._files = files
+        self._lock = lock
+        self._queue = work_queue
+
+    def run(self):
+        while True:
+            # Block for the first item, then opportunistically drain a batch
+            items = [self._queue.get()]
+            while len(items) < BATCH_MAX_EVENTS:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            # Group by target file so each gets at most one write per batch
+            grouped: Dict[Path, List[bytes]] = {}
+            for file_path, payload in items:
+                grouped.setdefault(file_path, []).append(payload)
+
+            try:
+                with self._lock:
+                    for file_path, payloads in grouped.items():
+                        fh = self._files[file_path]
+                        if fh.closed:
+                            continue
+                        if len(payloads) == 1 or not _HAS_WRITEV:
+                            fh.write(b''.join(payloads))
+                        else:
+                            # Scatter-gather: the whole batch for this
+                            # file goes out in one syscall without the
+                            # join() copy. Flush first so buffered and
+                            # raw writes can't reorder.
+                            fh.flush()
+                            _writev_all(fh.fileno(), payloads)
+            finally:
+                for _ in items:
+                    self._queue.task_done()
 
 class AuditStorage:
     """Handles persistent storage of audit logs"""
-    
-    def __init__(self, audit_dir: str = "data/audit"):
+
+    def __init__(self, audit_dir: str = "data/audit", durable: bool = None):
         self.audit_dir = Path(audit_dir)
         self.audit_dir.mkdir(parents=True, exist_ok=True)
-        
+        self.durable = settings.AUDIT_DURABLE if durable is None else durable
+
         # Separate files for different log types
         self.screening_log = self.audit_dir / "screening_events.jsonl"
         self.matches_log = self.audit_dir / "match_details.jsonl"
         self.system_log = self.audit_dir / "system_events.jsonl"
-    
+
+        # Long-lived handles: avoids an open()/close() pair per log event
+        self._files = {
+            path: self._open_log(path)
+            for path in (self.screening_log, self.matches_log, self.system_log)
+        }
+        self._lock = threading.Lock()
+
+        # Writes go through a bounded queue so callers never block on disk
+        self._queue = queue.Queue(maxsize=QUEUE_MAX_EVENTS)
+        self._writer = _AuditWriter(self._files, self._lock, self._queue)
+        self._writer.start()
+
+        self._stop_flusher = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flusher.start()
+
+        # The daemon threads keep the module-level singleton alive
+        # through interpreter shutdown, so __del__ never runs for it;
+        # atexit fires before daemon threads are torn down and drains
+        # whatever the buffers still hold. Without it a short-lived
+        # process (the CLI) exits with its events stuck in the 1 MiB
+        # userspace buffer and the log files never grow.
+        self._closed = False
+        atexit.register(self.close)
+
+    def _open_log(self, file_path: Path):
+        """Open a log file for appending
+
+        In durable mode the file is opened with O_DSYNC and unbuffered,
+        so each batched write from the writer thread is one syscall that
+        commits to disk before returning - no separate fdatasync needed.
+        """
+        if not self.durable:
+            return open(file_path, 'ab', buffering=1 << 20)
+
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+        flags |= getattr(os, 'O_DSYNC', getattr(os, 'O_SYNC', 0))
+        fd = os.open(file_path, flags, 0o640)
+        return os.fdopen(fd, 'ab', buffering=0)
+
     def log_screening(self, entry: LogEntry) -> None:
         """Log screening event"""
         self._append_jsonl(self.screening_log, entry.to_dict())
-    
+
+    def log_screenings(self, entries: List[LogEntry]) -> None:
+        """Log many screening events as one write"""
+        self._append_jsonl_many(self.screening_log, [entry.to_dict() for entry in entries])
+
     def log_matches(self, matches: List[MatchEntry]) -> None:
         """Log match details"""
-        for match in matches:
-            self._append_jsonl(self.matches_log, match.to_dict())
-    
+        self._append_jsonl_many(self.matches_log, [match.to_dict() for match in matches])
+
+    def log_bundle(self, entry: LogEntry, matches: List[MatchEntry]) -> None:
+        """Log a screening event and its match details together"""
+        self.log_screening(entry)
+        if matches:
+            self.log_matches(matches)
+
     def log_system_event(self, event_type: str, details: Dict[str, Any]) -> None:
         """Log system events (startup, errors, etc.)"""
         event = {
@@ -35,20 +180,274 @@ class AuditStorage:
             'details': details
         }
         self._append_jsonl(self.system_log, event)
-    
+
     def _append_jsonl(self, file_path: Path, data: Dict[str, Any]) -> None:
-        """Append JSON line to file"""
-        with open(file_path, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(data) + '\n')
-    
+        """Append single JSON line to file"""
+        self._append_jsonl_many(file_path, [data])
+
+    def _append_jsonl_many(self, file_path: Path, rows: List[Dict[str, Any]]) -> None:
+        """Queue multiple JSON lines as a single payload for the writer"""
+        if not rows:
+            return
+        payload = b'\n'.join(_dumps(row) for row in rows) + b'\n'
+        self._queue.put((file_path, payload))
+
+    def _flush_loop(self) -> None:
+        """Periodically flush buffered writes instead of syncing per event"""
+        while not self._stop_flusher.wait(FLUSH_INTERVAL_SECONDS):
+            self.flush()
+
+    def flush(self) -> None:
+        """Drain queued events and flush buffered log writes to disk"""
+        if self._writer.is_alive():
+            self._queue.join()
+        with self._lock:
+            for fh in self._files.values():
+                if not fh.closed:
+                    fh.flush()
+                    os.fsync(fh.fileno())
+
+    def close(self) -> None:
+        """Flush and close all log files; safe to call more than once
+
+        Idempotent because it runs from atexit and may run again from
+        __del__.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._stop_flusher.set()
+        self._drain_pending()
+        with self._lock:
+            for fh in self._files.values():
+                if not fh.closed:
+                    fh.flush()
+                    fh.close()
+
+    def _drain_pending(self) -> None:
+        """Write anything still queued; the writer thread may be gone"""
+        while True:
+            try:
+                file_path, payload = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            with self._lock:
+                fh = self._files[file_path]
+                if not fh.closed:
+                    fh.write(payload)
+            self._queue.task_done()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def get_recent_screenings(self, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get recent screening events"""
+        """Get recent screening events (newest first)"""
         if not self.screening_log.exists():
             return []
-        
-        entries = []
-        with open(self.screening_log, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            for line in reversed(lines[-limit:]):
-                entries.append(json.loads(line.strip()))
-        return entries
\ No newline at end of file
+
+        self.flush()  # Make queued/buffered events visible to the read below
+        lines = _tail_lines(self.screening_log, limit)
+        return [json.loads(line) for line in reversed(lines)]
+
+def _tail_lines(file_path: Path, limit: int) -> List[bytes]:
+    """Read the last `limit` lines of a file without scanning it all
+
+    Seeks from the end in 64 KiB chunks until enough newlines are
+    found, so the cost is O(limit * line length) regardless of how
+    large the log has grown.
+    """
+    chunk_size = 64 * 1024
+    with open(file_path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        buf = b''
+        while pos > 0 and buf.count(b'\n') <= limit:
+            step = min(chunk_size, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+    return buf.splitlines()[-limit:]
+
+class ParquetAuditStorage:
+    """Append-only Parquet audit storage for high-volume deployments
+
+    Drop-in alternative to the JSONL AuditStorage: events buffer in
+    memory and flush as compressed Parquet row groups, which cuts file
+    size by roughly an order of magnitude (dictionary encoding for
+    decision/risk_level/source plus Snappy) and makes reads
+    column-selective instead of full row scans. Requires pyarrow.
+
+    Each log is a set of part files (e.g.
+    screening_events-20260830_120000_000000.parquet), one per writer
+    session: Parquet files are immutable once their footer is written,
+    so appending across process restarts means starting a new part
+    rather than reopening (and truncating) an existing file. Reads
+    finalize the current part and scan the whole set.
+    """
+
+    # Events buffered before a row group is written
+    ROW_GROUP_EVENTS = 4096
+
+    def __init__(self, audit_dir: str = "data/audit"):
+        if pa is None:
+            raise ImportError("pyarrow is required for ParquetAuditStorage")
+
+        self.audit_dir = Path(audit_dir)
+        self.audit_dir.mkdir(parents=True, exist_ok=True)
+
+        # Logical log paths; the actual part files add a per-session
+        # timestamp suffix to the stem (see _new_part_path)
+        self.screening_log = self.audit_dir / "screening_events.parquet"
+        self.matches_log = self.audit_dir / "match_details.parquet"
+        self.system_log = self.audit_dir / "system_events.parquet"
+
+        self._schemas = {
+            self.screening_log: pa.schema([
+                ('screening_id', pa.string()),
+                ('timestamp', pa.string()),
+                ('event_type', pa.string()),
+                ('query', pa.string()),
+                ('decision', pa.string()),
+                ('risk_level', pa.string()),
+                ('matches_count', pa.int32()),
+                ('processing_time_ms', pa.float32()),
+                ('user_id', pa.string()),
+                ('session_id', pa.string()),
+                ('source_ip', pa.string()),
+            ]),
+            self.matches_log: pa.schema([
+                ('screening_id', pa.string()),
+                ('target_name', pa.string()),
+                ('source', pa.string()),
+                ('match_score', pa.float32()),
+                ('risk_score', pa.float32()),
+                ('match_type', pa.string()),
+            ]),
+            self.system_log: pa.schema([
+                ('timestamp', pa.string()),
+                ('event_type', pa.string()),
+                ('details', pa.string()),
+            ]),
+        }
+        self._buffers = {path: [] for path in self._schemas}
+        self._writers = {}
+        self._lock = threading.Lock()
+
+    def log_screening(self, entry: LogEntry) -> None:
+        """Log screening event"""
+        self._append(self.screening_log, entry.to_dict())
+
+    def log_screenings(self, entries: List[LogEntry]) -> None:
+        """Log many screening events"""
+        with self._lock:
+            self._buffers[self.screening_log].extend(e.to_dict() for e in entries)
+            self._maybe_write(self.screening_log)
+
+    def log_matches(self, matches: List[MatchEntry]) -> None:
+        """Log match details"""
+        with self._lock:
+            self._buffers[self.matches_log].extend(m.to_dict() for m in matches)
+            self._maybe_write(self.matches_log)
+
+    def log_bundle(self, entry: LogEntry, matches: List[MatchEntry]) -> None:
+        """Log a screening event and its match details together"""
+        self.log_screening(entry)
+        if matches:
+            self.log_matches(matches)
+
+    def log_system_event(self, event_type: str, details: Dict[str, Any]) -> None:
+        """Log system events (startup, errors, etc.)"""
+        self._append(self.system_log, {
+            'timestamp': datetime.now().isoformat(),
+            'event_type': event_type,
+            'details': json.dumps(details)  # Nested data stored as JSON text
+        })
+
+    def _append(self, file_path: Path, row: Dict[str, Any]) -> None:
+        """Buffer one row and flush a row group when the buffer fills"""
+        with self._lock:
+            self._buffers[file_path].append(row)
+            self._maybe_write(file_path)
+
+    def _maybe_write(self, file_path: Path) -> None:
+        """Write buffered rows as a row group if the buffer is full (lock held)"""
+        if len(self._buffers[file_path]) >= self.ROW_GROUP_EVENTS:
+            self._write_rows(file_path)
+
+    def _new_part_path(self, file_path: Path) -> Path:
+        """Fresh part file path for one writer session
+
+        Never reuses an existing file: ParquetWriter truncates its
+        target, so appending to a prior session's part would destroy
+        it. The timestamp keeps name-sorted parts in write order.
+        """
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+        return file_path.with_name(f"{file_path.stem}-{stamp}.parquet")
+
+    def _part_files(self, file_path: Path) -> List[Path]:
+        """All finalized part files for one log, oldest first"""
+        return sorted(self.audit_dir.glob(f"{file_path.stem}-*.parquet"))
+
+    def _write_rows(self, file_path: Path) -> None:
+        """Flush the buffer for one file as a Parquet row group (lock held)"""
+        rows = self._buffers[file_path]
+        if not rows:
+            return
+        schema = self._schemas[file_path]
+        table = pa.Table.from_pylist(rows, schema=schema)
+        writer = self._writers.get(file_path)
+        if writer is None:
+            writer = pq.ParquetWriter(self._new_part_path(file_path), schema,
+                                      compression='snappy')
+            self._writers[file_path] = writer
+        writer.write_table(table)
+        self._buffers[file_path] = []
+
+    def _close_writer(self, file_path: Path) -> None:
+        """Finalize the current part file, if any (lock held)
+
+        Closing writes the Parquet footer, without which the part is
+        unreadable; the next write starts a new part.
+        """
+        writer = self._writers.pop(file_path, None)
+        if writer is not None:
+            writer.close()
+
+    def flush(self) -> None:
+        """Write all buffered rows to their Parquet files"""
+        with self._lock:
+            for file_path in self._buffers:
+                self._write_rows(file_path)
+
+    def close(self) -> None:
+        """Flush buffers and finalize all open part files"""
+        with self._lock:
+            for file_path in self._buffers:
+                self._write_rows(file_path)
+                self._close_writer(file_path)
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def get_recent_screenings(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get recent screening events (newest first)
+
+        Flushes the buffer and finalizes the current part first: a
+        live ParquetWriter's file has no footer yet, so only closed
+        parts are readable.
+        """
+        with self._lock:
+            self._write_rows(self.screening_log)
+            self._close_writer(self.screening_log)
+            parts = self._part_files(self.screening_log)
+
+        rows: List[Dict[str, Any]] = []
+        for part in parts:
+            rows.extend(pq.read_table(part).to_pylist())
+        return rows[-limit:][::-1]
@@ -17,4 +17,12 @@ MAX_BATCH_SIZE = int(os.getenv("MAX_BATCH_SIZE", "1000"))
 
 # Compliance
 AUDIT_ENABLED = os.getenv("AUDIT_ENABLED", "true").lower() == "true"
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
\ No newline at end of file
+# Durable audit mode: every batched audit write commits to disk before
+# returning (O_DSYNC), for deployments with sync-per-event requirements
+AUDIT_DURABLE = os.getenv("AUDIT_DURABLE", "false").lower() == "true"
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+
+# CLI
+# How long the processed sanctions frame cached between CLI runs stays
+# valid before the next invocation re-downloads the source lists
+CLI_CACHE_TTL_HOURS = int(os.getenv("CLI_CACHE_TTL_HOURS", "24"))
\ No newline at end of file
@@ -17,6 +17,54 @@ class Priority(Enum):
     HIGH = "HIGH"
     CRITICAL = "CRITICAL"
 
+# Precomputed decision tables: built once at import instead of on
+# every decision
+
+_VALID_ACTIONS = frozenset(action.value for action in DecisionAction)
+_VALID_PRIORITIES = frozenset(priority.value for priority in Priority)
+_REQUIRED_FIELDS = ('action', 'reason', 'timestamp', 'confidence', 'priority')
+
+_SLA_HOURS = {
+    (action, priority): hours
+    for action, row in {
+        DecisionAction.AUTO_CLEAR.value: {'LOW': 0, 'MEDIUM': 0, 'HIGH': 0, 'CRITICAL': 0},
+        DecisionAction.MANUAL_REVIEW.value: {'LOW': 72, 'MEDIUM': 24, 'HIGH': 8, 'CRITICAL': 2},
+        DecisionAction.ESCALATE.value: {'LOW': 48, 'MEDIUM': 12, 'HIGH': 4, 'CRITICAL': 1},
+        DecisionAction.BLOCK.value: {'LOW': 24, 'MEDIUM': 8, 'HIGH': 2, 'CRITICAL': 0}
+    }.items()
+    for priority, hours in row.items()
+}
+
+_REQUIRES_APPROVAL = {
+    DecisionAction.AUTO_CLEAR.value: False,
+    DecisionAction.MANUAL_REVIEW.value: False,
+    DecisionAction.ESCALATE.value: True,
+    DecisionAction.BLOCK.value: True
+}
+
+_WORKFLOW_ROUTING = {
+    DecisionAction.AUTO_CLEAR.value: {
+        'queue': 'auto_processed',
+        'notification': False,
+        'escalation_path': None
+    },
+    DecisionAction.MANUAL_REVIEW.value: {
+        'queue': 'analyst_review',
+        'notification': True,
+        'escalation_path': None  # 'supervisor' for HIGH/CRITICAL priority
+    },
+    DecisionAction.ESCALATE.value: {
+        'queue': 'senior_analyst',
+        'notification': True,
+        'escalation_path': 'compliance_manager'
+    },
+    DecisionAction.BLOCK.value: {
+        'queue': 'immediate_action',
+        'notification': True,
+        'escalation_path': 'compliance_manager'
+    }
+}
+
 class DecisionMaker:
     """Create and validate compliance decisions"""
     
@@ -44,72 +92,35 @@ class DecisionMaker:
     
     def _requires_approval(self, action: str) -> bool:
         """Check if decision requires supervisor approval"""
-        approval_required = {
-            DecisionAction.AUTO_CLEAR.value: False,
-            DecisionAction.MANUAL_REVIEW.value: False,
-            DecisionAction.ESCALATE.value: True,
-            DecisionAction.BLOCK.value: True
-        }
-        return approval_required.get(action, True)
-    
+        return _REQUIRES_APPROVAL.get(action, True)
+
     def _get_sla_hours(self, action: str, priority: str) -> int:
         """Get SLA hours based on action and priority"""
-        sla_matrix = {
-            DecisionAction.AUTO_CLEAR.value: {'LOW': 0, 'MEDIUM': 0, 'HIGH': 0, 'CRITICAL': 0},
-            DecisionAction.MANUAL_REVIEW.value: {'LOW': 72, 'MEDIUM': 24, 'HIGH': 8, 'CRITICAL': 2},
-            DecisionAction.ESCALATE.value: {'LOW': 48, 'MEDIUM': 12, 'HIGH': 4, 'CRITICAL': 1},
-            DecisionAction.BLOCK.value: {'LOW': 24, 'MEDIUM': 8, 'HIGH': 2, 'CRITICAL': 0}
-        }
-        
-        return sla_matrix.get(action, {}).get(priority, 24)
+        return _SLA_HOURS.get((action, priority), 24)
     
     def validate_decision(self, decision: Dict[str, Any]) -> bool:
         """Validate decision structure and content"""
-        required_fields = ['action', 'reason', 'timestamp', 'confidence', 'priority']
-        
         # Check required fields
-        for field in required_fields:
+        for field in _REQUIRED_FIELDS:
             if field not in decision:
                 return False
-        
-        # Validate action
-        valid_actions = [action.value for action in DecisionAction]
-        if decision['action'] not in valid_actions:
-            return False
-        
-        # Validate priority
-        valid_priorities = [priority.value for priority in Priority]
-        if decision['priority'] not in valid_priorities:
-            return False
-        
-        return True
+
+        # Validate action and priority against the precomputed sets
+        return (decision['action'] in _VALID_ACTIONS and
+                decision['priority'] in _VALID_PRIORITIES)
     
     def get_workflow_routing(self, decision: Dict[str, Any]) -> Dict[str, Any]:
         """Get workflow routing information"""
         action = decision.get('action')
         priority = decision.get('priority', 'MEDIUM')
-        
-        routing = {
-            DecisionAction.AUTO_CLEAR.value: {
-                'queue': 'auto_processed',
-                'notification': False,
-                'escalation_path': None
-            },
-            DecisionAction.MANUAL_REVIEW.value: {
-                'queue': 'analyst_review',
-                'notification': True,
-                'escalation_path': 'supervisor' if priority in ['HIGH', 'CRITICAL'] else None
-            },
-            DecisionAction.ESCALATE.value: {
-                'queue': 'senior_analyst',
-                'notification': True,
-                'escalation_path': 'compliance_manager'
-            },
-            DecisionAction.BLOCK.value: {
-                'queue': 'immediate_action',
-                'notification': True,
-                'escalation_path': 'compliance_manager'
-            }
-        }
-        
-        return routing.get(action, routing[DecisionAction.MANUAL_REVIEW.value])
\ No newline at end of file
+
+        base = _WORKFLOW_ROUTING.get(action, _WORKFLOW_ROUTING[DecisionAction.MANUAL_REVIEW.value])
+        routing = dict(base)  # copy so callers can't mutate the shared table
+
+        # Manual review (also the fallback for unknown actions)
+        # escalates to a supervisor at high priority
+        if (base is _WORKFLOW_ROUTING[DecisionAction.MANUAL_REVIEW.value] and
+                priority in ('HIGH', 'CRITICAL')):
+            routing['escalation_path'] = 'supervisor'
+
+        return routing
\ No newline at end of file
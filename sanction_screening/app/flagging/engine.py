@@ -1,4 +1,6 @@
 """Main flagging engine orchestration"""
+import secrets
+import time
 from typing import Dict, Any
 from .rules import BusinessRules
 from .decisions import DecisionMaker
@@ -14,38 +16,44 @@ class FlaggingEngine:
         
     def process_screening_result(self, screening_result: Dict[str, Any]) -> Dict[str, Any]:
         """Process screening result through flagging pipeline"""
-        
-        # Step 1: Apply false positive filters
+
+        # Bind the hot fields once instead of re-fetching per step
         original_matches = screening_result.get('matches', [])
-        filtered_matches = self.fp_filter.apply_filters(
-            original_matches, 
-            screening_result.get('query', '')
-        )
-        
-        # Update screening result with filtered matches
-        screening_result['matches'] = filtered_matches
-        screening_result['filtered_count'] = len(original_matches) - len(filtered_matches)
-        
-        # Step 2: Apply business rules to make decision
+        query = screening_result.get('query', '')
+
+        # Step 1: Apply false positive filters (a no-op with zero
+        # matches, so the common no-match case skips the filter pass)
+        if not original_matches:
+            screening_result['matches'] = original_matches
+            screening_result['filtered_count'] = 0
+        else:
+            filtered_matches = self.fp_filter.apply_filters(original_matches, query)
+            screening_result['matches'] = filtered_matches
+            screening_result['filtered_count'] = len(original_matches) - len(filtered_matches)
+
+        # Step 2: Apply business rules to make decision. Every result,
+        # no-match included, goes through the rule chain so decisions
+        # come from the rules' own summaries and rule_stats stays an
+        # honest record of what fired
         flagged_result = self.business_rules.apply_rules(screening_result)
-        
+
         # Step 3: Validate and enhance decision
-        decision = flagged_result.get('decision', {})
+        decision = flagged_result.get('decision') or {}
         if self.decision_maker.validate_decision(decision):
             # Add workflow routing information
             decision['workflow'] = self.decision_maker.get_workflow_routing(decision)
-            flagged_result['decision'] = decision
         else:
             # Fallback decision if validation fails
-            flagged_result['decision'] = self.decision_maker.create_decision(
+            decision = self.decision_maker.create_decision(
                 'MANUAL_REVIEW',
                 'Decision validation failed, routing for manual review',
                 priority='MEDIUM'
             )
-        
+        flagged_result['decision'] = decision
+
         # Step 4: Add compliance metadata
         flagged_result['compliance'] = self._generate_compliance_metadata(flagged_result)
-        
+
         return flagged_result
     
     def _generate_compliance_metadata(self, result: Dict[str, Any]) -> Dict[str, Any]:
@@ -55,9 +63,9 @@ class FlaggingEngine:
         
         metadata = {
             'screening_id': self._generate_screening_id(),
-            'total_matches_found': len(result.get('matches', [])) + result.get('filtered_count', 0),
+            'total_matches_found': len(matches) + result.get('filtered_count', 0),
             'matches_after_filtering': len(matches),
-            'highest_risk_score': max([m.get('risk_score', 0) for m in matches], default=0),
+            'highest_risk_score': max((m.get('risk_score', 0) for m in matches), default=0),
             'decision_action': decision.get('action'),
             'decision_confidence': decision.get('confidence'),
             'requires_approval': decision.get('requires_approval', False),
@@ -68,23 +76,18 @@ class FlaggingEngine:
         
         # Add risk assessment
         if matches:
+            best_match = matches[0]
             metadata['risk_assessment'] = {
-                'primary_concern': matches[0].get('source', 'Unknown'),
-                'match_type': matches[0].get('match_type', 'Unknown'),
-                'confidence_level': matches[0].get('confidence', 'MEDIUM')
+                'primary_concern': best_match.get('source', 'Unknown'),
+                'match_type': best_match.get('match_type', 'Unknown'),
+                'confidence_level': best_match.get('confidence', 'MEDIUM')
             }
         
         return metadata
     
     def _generate_screening_id(self) -> str:
         """Generate unique screening ID for audit trail"""
-        import uuid
-        from datetime import datetime
-        
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        unique_id = str(uuid.uuid4())[:8]
-        
-        return f"SLST_{timestamp}_{unique_id}"
+        return f"SLST_{time.strftime('%Y%m%d_%H%M%S')}_{secrets.token_hex(4)}"
     
     def get_decision_summary(self, result: Dict[str, Any]) -> Dict[str, Any]:
         """Get human-readable decision summary"""
@@ -1,142 +1,114 @@
 """False positive reduction filters"""
-from typing import List, Dict, Any
+from dataclasses import dataclass
+from typing import FrozenSet, List, Dict, Any, Optional
 import re
 
+# Very common business words that cause weak matches
+COMMON_WORDS = frozenset({
+    'company', 'corporation', 'limited', 'ltd', 'inc', 'llc',
+    'bank', 'group', 'international', 'trading', 'services',
+    'foundation', 'association', 'organization', 'society'
+})
+
+# Titles and honorifics
+TITLES = frozenset({'mr', 'mrs', 'ms', 'dr', 'prof', 'sir', 'lady', 'lord'})
+
+# Common geographic terms that cause false positives
+GEOGRAPHIC_TERMS = frozenset({
+    'north', 'south', 'east', 'west', 'central', 'new', 'old',
+    'city', 'town', 'village', 'county', 'state', 'province',
+    'republic', 'kingdom', 'emirates', 'federation'
+})
+
+def _compile_vocabulary(words) -> "re.Pattern":
+    """Compile a word set into a single word-bounded regex alternation"""
+    alternation = '|'.join(sorted(words, key=len, reverse=True))
+    return re.compile(r'\b(?:' + alternation + r')\b')
+
+@dataclass(slots=True)
+class QueryContext:
+    """Query-derived data computed once per apply_filters call"""
+    lower: str
+    words: FrozenSet[str]
+    has_common: bool
+    has_geo: bool
+
 class FalsePositiveFilter:
     """Reduce false positives through intelligent filtering"""
-    
+
     def __init__(self):
-        self.filters = {
-            'common_words': self._filter_common_words,
-            'short_names': self._filter_short_names,
-            'title_only': self._filter_title_only_matches,
-            'partial_weak': self._filter_weak_partial_matches,
-            'geographic': self._filter_geographic_false_positives
-        }
-    
+        # One compiled alternation per vocabulary: a single scan of the
+        # string instead of one substring search per word
+        self._common_re = _compile_vocabulary(COMMON_WORDS)
+        self._geo_re = _compile_vocabulary(GEOGRAPHIC_TERMS)
+
     def apply_filters(self, matches: List[Dict[str, Any]], query: str) -> List[Dict[str, Any]]:
-        """Apply all false positive filters"""
-        filtered_matches = matches.copy()
-        
-        for filter_name, filter_func in self.filters.items():
-            filtered_matches = filter_func(filtered_matches, query)
-            
-        return filtered_matches
-    
-    def _filter_common_words(self, matches: List[Dict], query: str) -> List[Dict]:
-        """Filter matches on very common words"""
-        common_words = {
-            'company', 'corporation', 'limited', 'ltd', 'inc', 'llc',
-            'bank', 'group', 'international', 'trading', 'services',
-            'foundation', 'association', 'organization', 'society'
-        }
-        
-        query_lower = query.lower()
-        
-        filtered = []
-        for match in matches:
-            target_name = match.get('target_name', '').lower()
-            
-            # If match is only on common business words, filter out low scores
-            if (any(word in query_lower for word in common_words) and
-                any(word in target_name for word in common_words) and
-                match.get('score', 0) < 75.0):
-                
-                match['filtered'] = True
-                match['filter_reason'] = 'Common business word match'
-            else:
-                filtered.append(match)
-                
-        return filtered
-    
-    def _filter_short_names(self, matches: List[Dict], query: str) -> List[Dict]:
-        """Filter matches on very short names"""
+        """Apply all false positive filters in a single pass
+
+        Returns a new list of the kept match dicts; the input list is
+        never mutated (dropped match dicts are annotated in place).
+        """
+        if not matches:
+            return []
+
+        # Don't match very short queries at all
         if len(query.strip()) <= 3:
-            return []  # Don't match very short queries
-        
-        filtered = []
-        for match in matches:
-            target_name = match.get('target_name', '')
-            
-            # Filter short target names with low scores
-            if len(target_name.strip()) <= 3 and match.get('score', 0) < 90.0:
-                match['filtered'] = True
-                match['filter_reason'] = 'Short name with low confidence'
-            else:
-                filtered.append(match)
-                
-        return filtered
-    
-    def _filter_title_only_matches(self, matches: List[Dict], query: str) -> List[Dict]:
-        """Filter matches that only match on titles/honorifics"""
-        titles = {'mr', 'mrs', 'ms', 'dr', 'prof', 'sir', 'lady', 'lord'}
-        
-        query_words = set(query.lower().split())
-        
-        filtered = []
-        for match in matches:
-            target_words = set(match.get('target_name', '').lower().split())
-            
-            # Check if match is primarily on titles
-            common_words = query_words & target_words
-            title_words = common_words & titles
-            
-            if (len(title_words) > 0 and 
-                len(title_words) / len(common_words) > 0.5 and
-                match.get('score', 0) < 80.0):
-                
-                match['filtered'] = True
-                match['filter_reason'] = 'Title-only match'
-            else:
-                filtered.append(match)
-                
-        return filtered
-    
-    def _filter_weak_partial_matches(self, matches: List[Dict], query: str) -> List[Dict]:
-        """Filter weak partial matches"""
-        filtered = []
-        
-        for match in matches:
-            match_type = match.get('match_type', '')
-            score = match.get('score', 0)
-            
-            # Filter weak token matches
-            if (match_type == 'token' and 
-                score < 70.0 and
-                match.get('details', {}).get('match_ratio', 0) < 0.6):
-                
-                match['filtered'] = True
-                match['filter_reason'] = 'Weak partial match'
-            else:
-                filtered.append(match)
-                
-        return filtered
-    
-    def _filter_geographic_false_positives(self, matches: List[Dict], query: str) -> List[Dict]:
-        """Filter geographic false positives"""
-        # Common geographic terms that cause false positives
-        geographic_terms = {
-            'north', 'south', 'east', 'west', 'central', 'new', 'old',
-            'city', 'town', 'village', 'county', 'state', 'province',
-            'republic', 'kingdom', 'emirates', 'federation'
-        }
-        
+            return []
+
+        # Query-dependent data is loop-invariant: derive it once here
         query_lower = query.lower()
-        
-        filtered = []
+        ctx = QueryContext(
+            lower=query_lower,
+            words=frozenset(query_lower.split()),
+            has_common=self._common_re.search(query_lower) is not None,
+            has_geo=self._geo_re.search(query_lower) is not None
+        )
+
+        # One pass: lowercase and score extracted once per match, all
+        # five predicates evaluated inline with short-circuit on the
+        # first filter that fires
+        kept = []
         for match in matches:
-            target_name = match.get('target_name', '').lower()
-            
-            # Check if match is primarily geographic
-            query_geo_words = sum(1 for term in geographic_terms if term in query_lower)
-            target_geo_words = sum(1 for term in geographic_terms if term in target_name)
-            
-            if (query_geo_words > 0 and target_geo_words > 0 and
-                match.get('score', 0) < 75.0):
-                
+            target_lower = match.get('target_name', '').lower()
+            score = match.get('score', 0)
+
+            reason = self._classify(match, target_lower, score, ctx)
+            if reason:
                 match['filtered'] = True
-                match['filter_reason'] = 'Geographic false positive'
+                match['filter_reason'] = reason
             else:
-                filtered.append(match)
-                
-        return filtered
\ No newline at end of file
+                kept.append(match)
+
+        return kept
+
+    def _classify(self, match: Dict[str, Any], target_lower: str, score: float,
+                  ctx: QueryContext) -> Optional[str]:
+        """Return the first filter reason that applies, or None to keep"""
+
+        # Match only on common business words
+        if ctx.has_common and score < 75.0 and self._common_re.search(target_lower):
+            return 'Common business word match'
+
+        # Very short target name with low confidence
+        if len(target_lower.strip()) <= 3 and score < 90.0:
+            return 'Short name with low confidence'
+
+        # Match primarily on titles/honorifics; integer compare instead
+        # of a per-row float ratio
+        if score < 80.0:
+            common_words = ctx.words.intersection(target_lower.split())
+            if common_words:
+                title_count = sum(1 for word in common_words if word in TITLES)
+                if title_count and title_count * 2 > len(common_words):
+                    return 'Title-only match'
+
+        # Weak partial (token) match
+        if (match.get('match_type', '') == 'token' and score < 70.0 and
+                match.get('details', {}).get('match_ratio', 0) < 0.6):
+            return 'Weak partial match'
+
+        # Match driven by geographic terms
+        if ctx.has_geo and score < 75.0 and self._geo_re.search(target_lower):
+            return 'Geographic false positive'
+
+        return None
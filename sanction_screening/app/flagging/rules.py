@@ -2,27 +2,42 @@
 from typing import Dict, Any, List
 from ..config import thresholds
 
+# Common names that generate false positives
+_COMMON_NAMES = frozenset({
+    'john smith', 'mary johnson', 'david brown', 'michael davis',
+    'james wilson', 'robert miller', 'william moore', 'richard taylor'
+})
+
 class BusinessRules:
     """Business rules for compliance decision making"""
     
     def __init__(self):
-        self.rules = {
-            'exact_ofac_block': self._exact_ofac_block,
-            'high_risk_escalate': self._high_risk_escalate,
-            'medium_risk_review': self._medium_risk_review,
-            'low_risk_clear': self._low_risk_clear,
-            'common_name_filter': self._common_name_filter
-        }
-    
+        # Ordered most-severe-first; the order is load-bearing. Rules
+        # overlap (a common name can also satisfy medium_risk_review
+        # or low_risk_clear), so evaluating them in any other order
+        # can change which decision fires.
+        self.rules = [
+            ('exact_ofac_block', self._exact_ofac_block),
+            ('high_risk_escalate', self._high_risk_escalate),
+            ('medium_risk_review', self._medium_risk_review),
+            ('low_risk_clear', self._low_risk_clear),
+            ('common_name_filter', self._common_name_filter)
+        ]
+        # Per-rule call/hit counters, kept as cheap telemetry for
+        # tuning thresholds offline
+        self.rule_stats = {name: {'calls': 0, 'hits': 0} for name, _ in self.rules}
+
     def apply_rules(self, screening_result: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply all business rules to screening result"""
+        """Apply business rules, short-circuiting on the first hit"""
         matches = screening_result.get('matches', [])
         summary = screening_result.get('summary', {})
-        
-        # Apply rules in priority order
-        for rule_name, rule_func in self.rules.items():
+
+        for rule_name, rule_func in self.rules:
+            stats = self.rule_stats[rule_name]
+            stats['calls'] += 1
             decision = rule_func(matches, summary, screening_result)
             if decision:
+                stats['hits'] += 1
                 return {
                     **screening_result,
                     'decision': decision,
@@ -44,6 +59,12 @@ class BusinessRules:
     
     def _exact_ofac_block(self, matches: List[Dict], summary: Dict, result: Dict) -> Dict[str, Any]:
         """Block immediately for exact OFAC matches"""
+        # Summary aggregate proves the rule can't fire for the common
+        # (non-blocking) case without scanning the matches. Default True
+        # keeps hand-built summaries without the flag working.
+        if not summary.get('has_exact_ofac', True):
+            return None
+
         for match in matches:
             if (match.get('source') == 'OFAC' and 
                 match.get('match_type') == 'exact' and
@@ -64,7 +85,9 @@ class BusinessRules:
         highest_score = summary.get('highest_score', 0)
         
         if highest_score >= 85.0:  # High confidence threshold
-            high_risk_match = max(matches, key=lambda m: m.get('risk_score', 0))
+            # rank_matches sorts descending by risk_score, so the top
+            # match is first; no need to rescan the list
+            high_risk_match = matches[0] if matches else {}
             
             return {
                 'action': 'ESCALATE',
@@ -90,6 +113,7 @@ class BusinessRules:
                 'reason': f'Medium-risk match requires review',
                 'confidence': 'MEDIUM',
                 'priority': 'MEDIUM',
+                'timestamp': 'auto-generated',
                 'assigned_to': 'analyst',
                 'match_details': best_match
             }
@@ -109,20 +133,18 @@ class BusinessRules:
     
     def _common_name_filter(self, matches: List[Dict], summary: Dict, result: Dict) -> Dict[str, Any]:
         """Filter common names that are likely false positives"""
-        query = result.get('query', '').lower().strip()
-        
-        # Common names that generate false positives
-        common_names = {
-            'john smith', 'mary johnson', 'david brown', 'michael davis',
-            'james wilson', 'robert miller', 'william moore', 'richard taylor'
-        }
-        
-        if query in common_names and summary.get('highest_score', 0) < 80.0:
+        # Prefer the query pre-normalized by the matching engine
+        query = result.get('query_norm')
+        if query is None:
+            query = result.get('query', '').lower().strip()
+
+        if query in _COMMON_NAMES and summary.get('highest_score', 0) < 80.0:
             return {
                 'action': 'AUTO_CLEAR',
                 'reason': 'Common name with low confidence match',
                 'confidence': 'MEDIUM',
                 'priority': 'LOW',
+                'timestamp': 'auto-generated',
                 'filter_applied': 'common_name'
             }
         return None
\ No newline at end of file
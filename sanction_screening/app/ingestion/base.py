@@ -1,10 +1,20 @@
 """Base loader for sanctions list ingestion"""
+import json
 import requests
 import pandas as pd
 from datetime import datetime
 from pathlib import Path
 from ..config import settings, endpoints
 
+# Validators (ETag/Last-Modified) from the previous download per URL,
+# used for conditional requests so unchanged lists are not re-fetched
+_META_FILE = settings.DATA_DIR / "raw" / ".download_meta.json"
+
+# Shared session so repeat downloads reuse pooled TCP/TLS connections
+# instead of paying a fresh handshake per request
+_SESSION = requests.Session()
+_SESSION.headers.update(endpoints.REQUEST_HEADERS)
+
 class BaseLoader:
     """Base class for sanctions list loaders"""
     
@@ -12,18 +22,52 @@ class BaseLoader:
         self.source_name = source_name
         self.timestamp = datetime.now()
         
-    def download(self, url: str) -> str:
-        """Download data from URL with error handling"""
+    def download(self, url: str, force_refresh: bool = False) -> str:
+        """Download data from URL with error handling
+
+        Sends the validators from the previous fetch so a server that
+        reports the list unchanged (304) costs one header exchange and
+        the cached body is reused from disk.
+        """
+        raw_dir = settings.DATA_DIR / "raw"
+        raw_dir.mkdir(exist_ok=True)
+        cache_file = raw_dir / f"{self.source_name.lower()}_latest"
+
+        meta = {}
+        if _META_FILE.exists():
+            try:
+                meta = json.loads(_META_FILE.read_text())
+            except (OSError, ValueError):
+                meta = {}
+
+        headers = {}
+        entry = meta.get(url, {})
+        if not force_refresh and cache_file.exists():
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
         try:
-            response = requests.get(
-                url, 
-                headers=endpoints.REQUEST_HEADERS,
-                timeout=settings.API_TIMEOUT
-            )
+            response = _SESSION.get(url, timeout=settings.API_TIMEOUT, headers=headers)
+            if response.status_code == 304:
+                return cache_file.read_text(encoding='utf-8')
             response.raise_for_status()
-            return response.text
         except requests.RequestException as e:
             raise Exception(f"Failed to download {self.source_name}: {e}")
+
+        data = response.text
+        try:
+            cache_file.write_text(data, encoding='utf-8')
+            meta[url] = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified')
+            }
+            _META_FILE.write_text(json.dumps(meta))
+        except OSError:
+            pass  # caching is best effort
+
+        return data
     
     def save_raw(self, data: str, filename: str):
         """Save raw data for audit trail"""
@@ -36,15 +80,15 @@ class BaseLoader:
     def standardize(self, data: pd.DataFrame) -> pd.DataFrame:
         """Convert to standard format"""
         required_columns = ['name', 'source', 'list_type', 'date_added']
-        
-        # Add missing columns with defaults
-        for col in required_columns:
-            if col not in data.columns:
-                if col == 'source':
-                    data[col] = self.source_name
-                elif col == 'date_added':
-                    data[col] = self.timestamp
-                else:
-                    data[col] = None
-                    
-        return data[required_columns]
\ No newline at end of file
+
+        # One reindex builds the projection and any missing columns in a
+        # single pass instead of inserting columns one at a time; scalar
+        # defaults are then broadcast only for genuinely absent columns
+        missing = set(required_columns).difference(data.columns)
+        data = data.reindex(columns=required_columns)
+        if 'source' in missing:
+            data['source'] = self.source_name
+        if 'date_added' in missing:
+            data['date_added'] = self.timestamp
+
+        return data
\ No newline at end of file
@@ -5,12 +5,14 @@ from .manager import ListManager
 app = typer.Typer(help="Sanctions list data ingestion commands")
 
 @app.command()
-def update():
+def update(
+    legacy_csv: bool = typer.Option(False, "--legacy-csv", help="Also write the consolidated list as CSV")
+):
     """Download and update all sanctions lists"""
     try:
         manager = ListManager()
-        list_data = manager.load_all()
-        consolidated = manager.consolidate(list_data)
+        list_data = manager.load_all(force_refresh=True)
+        consolidated = manager.consolidate(list_data, legacy_csv=legacy_csv)
         
         typer.echo(f"✅ Successfully updated sanctions lists")
         typer.echo(f"📊 Total entries: {len(consolidated)}")
@@ -27,11 +29,17 @@ def status():
     """Show status of current sanctions lists"""
     from ..config import settings
     
-    processed_file = settings.DATA_DIR / "processed" / "consolidated_sanctions.csv"
-    
+    processed_dir = settings.DATA_DIR / "processed"
+    processed_file = processed_dir / "consolidated_sanctions.parquet"
+    if not processed_file.exists():
+        processed_file = processed_dir / "consolidated_sanctions.csv"
+
     if processed_file.exists():
         import pandas as pd
-        df = pd.read_csv(processed_file)
+        if processed_file.suffix == '.parquet':
+            df = pd.read_parquet(processed_file)
+        else:
+            df = pd.read_csv(processed_file)
         typer.echo(f"📊 Current sanctions database: {len(df)} entries")
         typer.echo(f"📁 File: {processed_file}")
         typer.echo(f"📅 Last modified: {processed_file.stat().st_mtime}")
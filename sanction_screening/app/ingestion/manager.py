@@ -1,10 +1,17 @@
 """Sanctions list ingestion manager"""
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 from .ofac import OFACLoader
 from .un import UNLoader
 from ..config import settings
 
+try:
+    import pyarrow  # noqa: F401
+    _HAS_PARQUET = True
+except ImportError:  # pragma: no cover - optional dependency
+    _HAS_PARQUET = False
+
 class ListManager:
     """Manage loading from multiple sanctions list sources"""
     
@@ -14,42 +21,72 @@ class ListManager:
             'UN': UNLoader()
         }
         
-    def load_all(self) -> Dict[str, pd.DataFrame]:
-        """Load all available sanctions lists"""
+    def load_all(self, force_refresh: bool = False) -> Dict[str, pd.DataFrame]:
+        """Load all available sanctions lists concurrently
+
+        force_refresh bypasses the conditional-download validators and
+        re-fetches every source unconditionally.
+        """
         results = {}
         errors = []
-        
-        for source, loader in self.loaders.items():
-            try:
-                print(f"Loading {source} sanctions list...")
-                df = loader.load()
-                results[source] = df
-                print(f"✅ {source}: {len(df)} entries loaded")
-            except Exception as e:
-                error_msg = f"❌ {source}: {str(e)}"
-                errors.append(error_msg)
-                print(error_msg)
-                
+
+        # Downloads are I/O bound: fetching the sources in parallel
+        # makes startup wall time the slowest list, not the sum
+        print(f"Loading {', '.join(self.loaders)} sanctions lists...")
+        with ThreadPoolExecutor(max_workers=len(self.loaders)) as pool:
+            futures = {
+                source: pool.submit(loader.load, force_refresh)
+                for source, loader in self.loaders.items()
+            }
+
+            for source, future in futures.items():
+                try:
+                    df = future.result()
+                    results[source] = df
+                    print(f"✅ {source}: {len(df)} entries loaded")
+                except Exception as e:
+                    error_msg = f"❌ {source}: {str(e)}"
+                    errors.append(error_msg)
+                    print(error_msg)
+
         if errors and not results:
             raise Exception(f"All list loading failed: {'; '.join(errors)}")
-            
+
         return results
     
-    def consolidate(self, list_data: Dict[str, pd.DataFrame]) -> pd.DataFrame:
-        """Combine all lists into single DataFrame"""
+    def consolidate(self, list_data: Dict[str, pd.DataFrame], legacy_csv: bool = False) -> pd.DataFrame:
+        """Combine all lists into single DataFrame
+
+        The consolidated list is saved as Parquet when pyarrow is
+        available (smaller, typed, faster to reload); pass legacy_csv
+        to also write the CSV export for external auditors.
+        """
         if not list_data:
             return pd.DataFrame(columns=['name', 'source', 'list_type', 'date_added'])
             
         combined = pd.concat(list_data.values(), ignore_index=True)
-        
-        # Remove duplicates (same name from multiple sources)
-        combined = combined.drop_duplicates(subset=['name'], keep='first')
+
+        # Remove duplicates (same name from multiple sources); dedupe on
+        # a normalized key so entries differing only by case or
+        # surrounding whitespace collapse too
+        before = len(combined)
+        key = combined['name'].str.lower().str.strip()
+        combined = combined[~key.duplicated(keep='first')]
+        if len(combined) < before:
+            print(f"Deduplicated {before - len(combined)} of {before} entries")
         
         # Save consolidated list
         processed_dir = settings.DATA_DIR / "processed"
         processed_dir.mkdir(exist_ok=True)
-        
-        output_file = processed_dir / "consolidated_sanctions.csv"
-        combined.to_csv(output_file, index=False)
-        
+
+        if _HAS_PARQUET:
+            combined.to_parquet(
+                processed_dir / "consolidated_sanctions.parquet",
+                engine='pyarrow',
+                compression='zstd',
+                index=False
+            )
+        if legacy_csv or not _HAS_PARQUET:
+            combined.to_csv(processed_dir / "consolidated_sanctions.csv", index=False)
+
         return combined
\ No newline at end of file
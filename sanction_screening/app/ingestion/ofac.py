@@ -10,24 +10,25 @@ class OFACLoader(BaseLoader):
     def __init__(self):
         super().__init__("OFAC")
         
-    def load(self) -> pd.DataFrame:
+    def load(self, force_refresh: bool = False) -> pd.DataFrame:
         """Load and process OFAC SDN list"""
         # Download raw data
-        raw_data = self.download(endpoints.OFAC_SDN_URL)
+        raw_data = self.download(endpoints.OFAC_SDN_URL, force_refresh=force_refresh)
         self.save_raw(raw_data, "ofac_sdn.csv")
         
-        # Parse CSV
-        df = pd.read_csv(StringIO(raw_data))
-        
-        # Extract names (OFAC format has name in first column)
-        processed = pd.DataFrame({
-            'name': df.iloc[:, 1],  # Second column typically contains names
-            'list_type': 'SDN',
-            'entity_id': df.iloc[:, 0] if len(df.columns) > 0 else None
-        })
-        
+        # Parse only the two columns we use; the SDN file has no header
+        # row, so unused columns are never materialized
+        processed = pd.read_csv(
+            StringIO(raw_data),
+            usecols=[0, 1],
+            names=['entity_id', 'name'],
+            header=None,
+            dtype=str
+        )
+        processed['list_type'] = 'SDN'
+
         # Remove empty names
         processed = processed.dropna(subset=['name'])
         processed = processed[processed['name'].str.strip() != '']
-        
+
         return self.standardize(processed)
\ No newline at end of file
@@ -1,6 +1,7 @@
 """UN Security Council sanctions list loader"""
 import pandas as pd
 import xml.etree.ElementTree as ET
+from io import BytesIO
 from .base import BaseLoader
 from ..config import endpoints
 
@@ -10,39 +11,41 @@ class UNLoader(BaseLoader):
     def __init__(self):
         super().__init__("UN")
         
-    def load(self) -> pd.DataFrame:
+    def load(self, force_refresh: bool = False) -> pd.DataFrame:
         """Load and process UN consolidated list"""
         # Download raw XML
-        raw_data = self.download(endpoints.UN_CONSOLIDATED_URL)
+        raw_data = self.download(endpoints.UN_CONSOLIDATED_URL, force_refresh=force_refresh)
         self.save_raw(raw_data, "un_consolidated.xml")
         
-        # Parse XML
+        # Stream-parse the XML: one linear pass, records freed as they
+        # complete, instead of building the whole DOM and walking it
+        # twice with findall
         try:
-            root = ET.fromstring(raw_data)
             names = []
-            
-            # Extract individual names (simplified XML parsing)
-            for individual in root.findall('.//INDIVIDUAL'):
-                name_elem = individual.find('.//FIRST_NAME')
-                last_elem = individual.find('.//SECOND_NAME')
-                
-                if name_elem is not None and last_elem is not None:
-                    full_name = f"{name_elem.text} {last_elem.text}".strip()
-                    if full_name:
+
+            for _, elem in ET.iterparse(BytesIO(raw_data.encode('utf-8')), events=('end',)):
+                if elem.tag == 'INDIVIDUAL':
+                    name_elem = elem.find('.//FIRST_NAME')
+                    last_elem = elem.find('.//SECOND_NAME')
+
+                    if name_elem is not None and last_elem is not None:
+                        full_name = f"{name_elem.text} {last_elem.text}".strip()
+                        if full_name:
+                            names.append({
+                                'name': full_name,
+                                'list_type': 'Individual'
+                            })
+                    elem.clear()
+
+                elif elem.tag == 'ENTITY':
+                    name_elem = elem.find('.//FIRST_NAME')
+                    if name_elem is not None and name_elem.text:
                         names.append({
-                            'name': full_name,
-                            'list_type': 'Individual'
+                            'name': name_elem.text.strip(),
+                            'list_type': 'Entity'
                         })
-            
-            # Extract entity names
-            for entity in root.findall('.//ENTITY'):
-                name_elem = entity.find('.//FIRST_NAME')
-                if name_elem is not None and name_elem.text:
-                    names.append({
-                        'name': name_elem.text.strip(),
-                        'list_type': 'Entity'
-                    })
-                    
+                    elem.clear()
+
         except ET.ParseError as e:
             raise Exception(f"Failed to parse UN XML: {e}")
         
@@ -1,8 +1,29 @@
 """Pydantic models for API requests and responses"""
+from enum import Enum
 from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+class RiskLevel(str, Enum):
+    """Closed vocabulary for match risk levels"""
+    HIGH = "HIGH"
+    MEDIUM = "MEDIUM"
+    LOW = "LOW"
+    NONE = "NONE"
+
+class Confidence(str, Enum):
+    """Closed vocabulary for match confidence"""
+    HIGH = "HIGH"
+    MEDIUM = "MEDIUM"
+    LOW = "LOW"
+
+class MatchType(str, Enum):
+    """Closed vocabulary for matcher algorithms"""
+    EXACT = "exact"
+    FUZZY = "fuzzy"
+    TOKEN = "token"
+    UNKNOWN = "unknown"
+
 class ScreeningRequest(BaseModel):
     """Request model for name screening"""
     name: str = Field(..., min_length=2, max_length=200, description="Name to screen")
@@ -15,15 +36,21 @@ class BatchScreeningRequest(BaseModel):
     batch_id: Optional[str] = Field(None, description="Batch identifier")
 
 class MatchResult(BaseModel):
-    """Individual match result"""
-    target_name: str
-    source: str
-    list_type: str
-    score: float
-    risk_score: float
-    risk_level: str
-    confidence: str
-    match_type: str
+    """Individual match result
+
+    Defaults mirror the engine's match dicts so raw matches validate
+    directly without a hand-built intermediate dict. The enum fields
+    share one canonical value per member instead of a fresh string per
+    match, which matters for large batch responses.
+    """
+    target_name: str = ""
+    source: str = ""
+    list_type: str = ""
+    score: float = 0.0
+    risk_score: float = 0.0
+    risk_level: RiskLevel = RiskLevel.NONE
+    confidence: Confidence = Confidence.LOW
+    match_type: MatchType = MatchType.UNKNOWN
 
 class ScreeningResponse(BaseModel):
     """Response model for screening results"""
@@ -1,119 +1,280 @@
 """Main matching engine orchestration"""
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Any
+from collections import defaultdict
+from dataclasses import dataclass
+from rapidfuzz import fuzz, process
+from typing import List, Dict, Any, Tuple
 from .matchers import ExactMatcher, FuzzyMatcher, TokenMatcher
 from .scorer import MatchScorer
 from ..preprocessing.processor import NameProcessor
 from ..config import thresholds
 
+@dataclass(frozen=True, slots=True)
+class MatchingIndex:
+    """Sanctions columns extracted once for repeated screening
+
+    Plain tuples instead of DataFrame rows: screening loops read these
+    directly and skip all pandas indexing overhead.
+    """
+    names: Tuple[str, ...]
+    normalized: Tuple[str, ...]
+    normalized_cmp: Tuple[str, ...]
+    tokens: Tuple[list, ...]
+    sources: Tuple[str, ...]
+    list_types: Tuple[str, ...]
+    size: int
+    # lowered normalized name -> entry positions, for O(1) exact hits
+    exact_index: Dict[str, list] = None
+
 class MatchingEngine:
     """Main engine for sanctions list matching"""
-    
+
     def __init__(self):
         self.processor = NameProcessor()
         self.exact_matcher = ExactMatcher()
         self.fuzzy_matcher = FuzzyMatcher()
         self.token_matcher = TokenMatcher()
         self.scorer = MatchScorer()
-        
+        # Last (frame, prepared index) pair, so repeated screen_name
+        # calls against the same frame skip the column extraction
+        self._index_cache = (None, None)
+
+    def _cached_index(self, sanctions_df: pd.DataFrame) -> MatchingIndex:
+        """Prepared index for the frame, rebuilt only when it changes
+
+        Keyed on frame identity: callers reload sanctions data as a
+        new DataFrame object, so an identity miss means new data.
+        """
+        cached_df, cached_index = self._index_cache
+        if cached_df is not sanctions_df:
+            cached_index = self.prepare_index(sanctions_df)
+            self._index_cache = (sanctions_df, cached_index)
+        return cached_index
+
+    def prepare_index(self, sanctions_df: pd.DataFrame) -> MatchingIndex:
+        """Extract the screening columns from the DataFrame once"""
+        size = len(sanctions_df)
+
+        def col(label, default):
+            if label in sanctions_df.columns:
+                return tuple(sanctions_df[label].tolist())
+            return (default,) * size
+
+        names = col('name', '')
+        if 'normalized' in sanctions_df.columns:
+            normalized = tuple(sanctions_df['normalized'].tolist())
+        else:
+            normalized = names
+
+        # Exact-comparison strings lowered once at index build instead
+        # of once per screened name
+        normalized_cmp = tuple(
+            t.lower().strip() if isinstance(t, str) else t
+            for t in normalized
+        )
+
+        # Exact matching as one dict lookup per query instead of a
+        # comparison per entry
+        exact_index = defaultdict(list)
+        for pos, cmp_name in enumerate(normalized_cmp):
+            if cmp_name:
+                exact_index[cmp_name].append(pos)
+        exact_index = dict(exact_index)
+
+        return MatchingIndex(
+            names=names,
+            normalized=normalized,
+            normalized_cmp=normalized_cmp,
+            tokens=col('tokens', []),
+            sources=col('source', ''),
+            list_types=col('list_type', ''),
+            size=size,
+            exact_index=exact_index
+        )
+
+    def _exact_hits(self, query_processed: Dict, index: MatchingIndex):
+        """Exact matches via dict lookup, or None when there are none"""
+        query_cmp = query_processed['normalized'].lower().strip()
+        positions = index.exact_index.get(query_cmp) if index.exact_index else None
+        if not positions:
+            return None
+        return [
+            {
+                'match_type': 'exact',
+                'score': 100.0,
+                'is_match': True,
+                'details': {'exact_match': True},
+                'target_name': index.names[j],
+                'source': index.sources[j],
+                'list_type': index.list_types[j],
+                'confidence': 'HIGH'
+            }
+            for j in positions
+        ]
+
     def screen_name(self, query_name: str, sanctions_df: pd.DataFrame) -> Dict[str, Any]:
         """Screen a single name against sanctions list"""
+        return self.screen_name_prepared(query_name, self._cached_index(sanctions_df))
+
+    def screen_name_prepared(self, query_name: str, index: MatchingIndex) -> Dict[str, Any]:
+        """Screen a single name against a prepared MatchingIndex
+
+        Callers screening many names should build the index once with
+        prepare_index and use this entry point to skip the per-call
+        column extraction.
+        """
         if not query_name or len(query_name.strip()) < thresholds.MIN_NAME_LENGTH:
-            return {
-                'query': query_name,
-                'matches': [],
-                'summary': self.scorer.create_match_summary([])
-            }
-        
+            return self._empty_result(query_name)
+
         # Preprocess query name
         query_processed = self.processor.process_single(query_name)
-        
-        matches = []
-        
-        # Screen against each sanctions entry
-        for _, sanction_row in sanctions_df.iterrows():
-            match_results = self._match_against_entry(query_processed, sanction_row)
-            
-            if match_results:
-                matches.extend(match_results)
-        
-        # Score and rank matches
+
+        # Exact hit: one dict lookup settles the screening at score 100,
+        # so the whole fuzzy sweep is skipped
+        exact_matches = self._exact_hits(query_processed, index)
+        if exact_matches:
+            return self._build_result(query_name, query_processed, exact_matches)
+
+        # Score against every entry in one C call (bit-parallel, all
+        # cores); WRatio fuses the ratio/partial/token measures,
+        # matching SimilarityCalculator.weighted_average. No word-level
+        # pruning here: fuzzy matching exists precisely for queries
+        # that share no exact token with their target ("Usama Bin
+        # Ladin" vs "Osama bin Laden"), and the full scan stays cheap
+        # because score_cutoff drops sub-threshold entries inside C
+        score_row = process.cdist(
+            [query_processed['normalized']], index.normalized,
+            scorer=fuzz.WRatio, workers=-1,
+            score_cutoff=thresholds.LOW_RISK_THRESHOLD
+        )[0]
+
+        matches = self._collect_matches(query_processed, index, score_row)
+        return self._build_result(query_name, query_processed, matches)
+
+    def _empty_result(self, query_name: str) -> Dict[str, Any]:
+        """Result shape for queries too short to screen"""
+        return {
+            'query': query_name,
+            'query_norm': (query_name or '').lower().strip(),
+            'matches': [],
+            'summary': self.scorer.create_match_summary([])
+        }
+
+    def _build_result(self, query_name: str, query_processed: Dict,
+                      matches: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Score, filter and rank raw matches into a screening result"""
         for match in matches:
             match['risk_score'] = self.scorer.calculate_risk_score(
                 match, match.get('source', '')
             )
             match['risk_level'] = self.scorer.determine_risk_level(match['risk_score'])
-        
+
         # Filter out low-scoring matches
         significant_matches = [
-            m for m in matches 
+            m for m in matches
             if m.get('risk_score', 0) >= thresholds.LOW_RISK_THRESHOLD
         ]
-        
+
         # Rank by risk score
         ranked_matches = self.scorer.rank_matches(significant_matches)
-        
+
         return {
             'query': query_name,
+            'query_norm': query_name.lower().strip(),
             'processed_query': query_processed,
             'matches': ranked_matches,
             'summary': self.scorer.create_match_summary(ranked_matches)
         }
-    
-    def _match_against_entry(self, query_processed: Dict, sanction_row: pd.Series) -> List[Dict[str, Any]]:
-        """Match query against single sanctions entry"""
-        matches = []
-        
-        sanction_name = sanction_row.get('normalized', sanction_row.get('name', ''))
-        if not sanction_name:
-            return matches
-        
-        # Try exact match first
-        exact_result = self.exact_matcher.match(
-            query_processed['normalized'], 
-            sanction_name
-        )
-        
-        if exact_result['is_match']:
-            matches.append({
-                **exact_result,
-                'target_name': sanction_row.get('name', ''),
-                'source': sanction_row.get('source', ''),
-                'list_type': sanction_row.get('list_type', ''),
-                'confidence': 'HIGH'
-            })
-            return matches  # Exact match found, no need for fuzzy
-        
-        # Try fuzzy match
-        fuzzy_result = self.fuzzy_matcher.match(
-            query_processed['normalized'],
-            sanction_name
+
+    def screen_names(self, query_names: List[str], sanctions_df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """Screen a batch of names against the sanctions list
+
+        Batch entry point for the API and CLI: callers get one result
+        dict per name (same shape as screen_name). WRatio similarity
+        is computed for the whole batch in a single
+        rapidfuzz.process.cdist call (C-level, all cores) instead of
+        Python-level scorer calls per name pair; exact and token
+        matching reuse the per-entry pass.
+        """
+        index = self._cached_index(sanctions_df)
+        if not query_names or index.size == 0:
+            return [self.screen_name_prepared(name, index) for name in query_names]
+
+        processed = [
+            self.processor.process_single(name)
+            if name and len(name.strip()) >= thresholds.MIN_NAME_LENGTH else None
+            for name in query_names
+        ]
+        queries = [p['normalized'] if p else '' for p in processed]
+
+        score_matrix = process.cdist(
+            queries, index.normalized, scorer=fuzz.WRatio, workers=-1,
+            score_cutoff=thresholds.LOW_RISK_THRESHOLD
         )
-        
-        if fuzzy_result['is_match']:
+
+        results = []
+        for i, (query_name, query_processed) in enumerate(zip(query_names, processed)):
+            if query_processed is None:
+                results.append(self._empty_result(query_name))
+                continue
+
+            matches = self._exact_hits(query_processed, index)
+            if matches is None:
+                matches = self._collect_matches(query_processed, index, score_matrix[i])
+            results.append(self._build_result(query_name, query_processed, matches))
+
+        return results
+
+    def _collect_matches(self, query_processed: Dict, index: MatchingIndex,
+                         score_row) -> List[Dict[str, Any]]:
+        """Build match dicts for one query from a precomputed score row
+
+        The similarity scores arrive as cdist output (one WRatio value
+        per index entry); this pass only applies the fuzzy thresholds
+        and token matching. Exact hits are resolved beforehand via the
+        exact_index dict, so callers only reach here when no entry
+        equals the query.
+        """
+        matches = []
+
+        # Vectorized threshold filter: match dicts are only built for
+        # the (usually few) entries that survive it, instead of
+        # touching every scored entry at Python level
+        score_row = np.asarray(score_row)
+        for j in np.nonzero(score_row >= thresholds.LOW_RISK_THRESHOLD)[0]:
+            score = float(score_row[j])
+            if score >= thresholds.HIGH_RISK_THRESHOLD:
+                match_level = 'high'
+            elif score >= thresholds.MEDIUM_RISK_THRESHOLD:
+                match_level = 'medium'
+            else:
+                match_level = 'low'
             matches.append({
-                **fuzzy_result,
-                'target_name': sanction_row.get('name', ''),
-                'source': sanction_row.get('source', ''),
-                'list_type': sanction_row.get('list_type', ''),
-                'confidence': fuzzy_result['match_level'].upper()
+                'match_type': 'fuzzy',
+                'score': score,
+                'match_level': match_level,
+                'is_match': True,
+                'details': {'WRatio': score},
+                'target_name': index.names[j],
+                'source': index.sources[j],
+                'list_type': index.list_types[j],
+                'confidence': match_level.upper()
             })
-        
-        # Try token match for partial matches
-        sanction_tokens = sanction_row.get('tokens', [])
-        if sanction_tokens:
+
+        for j in range(index.size):
+            if not index.normalized[j] or not index.tokens[j]:
+                continue
             token_result = self.token_matcher.match(
-                query_processed['tokens'],
-                sanction_tokens
+                query_processed['tokens'], index.tokens[j]
             )
-            
             if token_result['is_match']:
                 matches.append({
                     **token_result,
-                    'target_name': sanction_row.get('name', ''),
-                    'source': sanction_row.get('source', ''),
-                    'list_type': sanction_row.get('list_type', ''),
+                    'target_name': index.names[j],
+                    'source': index.sources[j],
+                    'list_type': index.list_types[j],
                     'confidence': 'MEDIUM'
                 })
-        
+
         return matches
\ No newline at end of file
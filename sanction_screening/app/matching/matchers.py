@@ -1,4 +1,5 @@
 """Different matching strategies for name screening"""
+from rapidfuzz import fuzz, process
 from typing import List, Dict, Any
 from .similarity import SimilarityCalculator
 from ..config import thresholds
@@ -47,10 +48,7 @@ class FuzzyMatcher:
 
 class TokenMatcher:
     """Token-based matching for partial name matches"""
-    
-    def __init__(self):
-        self.similarity = SimilarityCalculator()
-        
+
     def match(self, query_tokens: List[str], target_tokens: List[str]) -> Dict[str, Any]:
         """Match individual tokens between names"""
         if not query_tokens or not target_tokens:
@@ -60,27 +58,30 @@ class TokenMatcher:
                 'is_match': False,
                 'details': {'matched_tokens': []}
             }
-        
+
         matched_tokens = []
         total_score = 0.0
-        
-        for q_token in query_tokens:
-            best_match_score = 0.0
-            best_match_token = None
-            
-            for t_token in target_tokens:
-                token_score = self.similarity.levenshtein_ratio(q_token, t_token)
-                if token_score > best_match_score:
-                    best_match_score = token_score
-                    best_match_token = t_token
-            
-            if best_match_score >= thresholds.LOW_RISK_THRESHOLD:
+
+        # One C call scores the whole token-pair matrix; score_cutoff
+        # still lets rapidfuzz abandon sub-threshold pairs early, and
+        # the best target per query token falls out of max/argmax
+        scores = process.cdist(
+            query_tokens, target_tokens,
+            scorer=fuzz.ratio,
+            score_cutoff=thresholds.LOW_RISK_THRESHOLD
+        )
+        best_scores = scores.max(axis=1)
+        best_indices = scores.argmax(axis=1)
+
+        for q_token, best_score, best_idx in zip(query_tokens, best_scores, best_indices):
+            if best_score >= thresholds.LOW_RISK_THRESHOLD:
+                best_score = float(best_score)
                 matched_tokens.append({
                     'query': q_token,
-                    'target': best_match_token,
-                    'score': best_match_score
+                    'target': target_tokens[best_idx],
+                    'score': best_score
                 })
-                total_score += best_match_score
+                total_score += best_score
         
         # Average score of matched tokens
         avg_score = total_score / len(query_tokens) if query_tokens else 0.0
@@ -60,17 +60,42 @@ class MatchScorer:
                 'can_auto_clear': True
             }
         
-        highest_score = max(m.get('risk_score', 0.0) for m in matches)
-        
+        # One pass collects the max score, per-level counts and the
+        # exact-OFAC flag instead of five separate scans of matches
+        highest_score = 0.0
+        high = medium = low = 0
+        has_exact_ofac = False
+
+        for m in matches:
+            score = m.get('risk_score', 0.0)
+            if score > highest_score:
+                highest_score = score
+
+            level = self.determine_risk_level(score)
+            if level == 'HIGH':
+                high += 1
+            elif level == 'MEDIUM':
+                medium += 1
+            elif level == 'LOW':
+                low += 1
+
+            if not has_exact_ofac:
+                has_exact_ofac = (
+                    m.get('source') == 'OFAC' and m.get('match_type') == 'exact' and
+                    (m.get('score', 0) == 100.0 or m.get('risk_score', 0) == 100.0)
+                )
+
         return {
             'total_matches': len(matches),
             'highest_risk': self.determine_risk_level(highest_score),
             'highest_score': highest_score,
             'requires_review': self.requires_review(highest_score),
             'can_auto_clear': self.should_auto_clear(highest_score),
+            # Precomputed so downstream rules can skip their match scans
+            'has_exact_ofac': has_exact_ofac,
             'risk_breakdown': {
-                'HIGH': len([m for m in matches if self.determine_risk_level(m.get('risk_score', 0)) == 'HIGH']),
-                'MEDIUM': len([m for m in matches if self.determine_risk_level(m.get('risk_score', 0)) == 'MEDIUM']),
-                'LOW': len([m for m in matches if self.determine_risk_level(m.get('risk_score', 0)) == 'LOW'])
+                'HIGH': high,
+                'MEDIUM': medium,
+                'LOW': low
             }
         }
\ No newline at end of file
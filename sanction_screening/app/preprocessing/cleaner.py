@@ -2,47 +2,63 @@
 import re
 import string
 
+# Compiled once at import: these run for every name on every list
+# refresh, so per-call re-compilation and table building add up
+_WS_RE = re.compile(r'\s+')
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation.replace("'", ""))  # Keep apostrophes
+
+# frozensets for O(1) membership in the per-word filters below
+_TITLES = frozenset({
+    'mr', 'mrs', 'ms', 'miss', 'dr', 'prof', 'sir', 'lady',
+    'lord', 'sheikh', 'imam', 'mullah', 'ayatollah'
+})
+_STOP_WORDS = frozenset({'and', 'or', 'the', 'of', 'bin', 'ibn', 'abu', 'al'})
+_SKIP_WORDS = _TITLES | _STOP_WORDS
+
 class TextCleaner:
     """Clean and standardize text for matching"""
-    
+
     def __init__(self):
         # Common punctuation to remove
         self.punctuation = string.punctuation.replace("'", "")  # Keep apostrophes
-        
+
     def clean(self, text: str) -> str:
         """Basic text cleaning"""
         if not text or not isinstance(text, str):
             return ""
-            
+
         # Convert to lowercase
         text = text.lower()
-        
+
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
+        text = _WS_RE.sub(' ', text)
+
         # Remove punctuation except apostrophes
-        text = text.translate(str.maketrans('', '', self.punctuation))
-        
+        text = text.translate(_PUNCT_TABLE)
+
         # Remove leading/trailing whitespace
         text = text.strip()
-        
+
         return text
-    
+
     def remove_titles(self, text: str) -> str:
         """Remove common titles and honorifics"""
-        titles = [
-            'mr', 'mrs', 'ms', 'miss', 'dr', 'prof', 'sir', 'lady',
-            'lord', 'sheikh', 'imam', 'mullah', 'ayatollah'
-        ]
-        
         words = text.split()
-        filtered = [w for w in words if w not in titles]
+        filtered = [w for w in words if w not in _TITLES]
         return ' '.join(filtered)
-    
+
     def remove_common_words(self, text: str) -> str:
         """Remove common connecting words"""
-        stop_words = ['and', 'or', 'the', 'of', 'bin', 'ibn', 'abu', 'al']
-        
         words = text.split()
-        filtered = [w for w in words if w not in stop_words]
-        return ' '.join(filtered)
\ No newline at end of file
+        filtered = [w for w in words if w not in _STOP_WORDS]
+        return ' '.join(filtered)
+
+    def remove_noise_words(self, text: str) -> str:
+        """Remove titles and connecting words in one pass
+
+        Equivalent to remove_titles followed by remove_common_words but
+        with a single split/join round trip.
+        """
+        words = text.split()
+        filtered = [w for w in words if w not in _SKIP_WORDS]
+        return ' '.join(filtered)
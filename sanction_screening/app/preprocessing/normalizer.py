@@ -2,58 +2,74 @@
 import re
 from unidecode import unidecode
 
+# Common name variations
+_REPLACEMENTS = {
+    'mohammed': ['muhammad', 'mohamed', 'mohammad'],
+    'abdul': ['abd', 'abdel', 'abdal'],
+    'al': ['el', 'ul'],
+    'ibn': ['bin', 'ben']
+}
+
+# Compiled once at import: one merged alternation replaces the per-call
+# loop that rebuilt a pattern per variant
+_VARIANT_TO_STANDARD = {
+    variant: standard
+    for standard, variants in _REPLACEMENTS.items()
+    for variant in variants
+}
+_VARIANTS_RE = re.compile(r'\b(' + '|'.join(_VARIANT_TO_STANDARD) + r')\b')
+_AL_PREFIX_RE = re.compile(r'\bal[\s\-]')
+_HYPHEN_RE = re.compile(r'\s*-\s*')
+_APOS_RE = re.compile(r"\s*'\s*")
+
 class NameNormalizer:
     """Advanced name normalization for international names"""
-    
+
     def __init__(self):
-        # Common name variations
-        self.replacements = {
-            'mohammed': ['muhammad', 'mohamed', 'mohammad'],
-            'abdul': ['abd', 'abdel', 'abdal'],
-            'al': ['el', 'ul'],
-            'ibn': ['bin', 'ben']
-        }
-        
+        self.replacements = _REPLACEMENTS
+
     def transliterate(self, text: str) -> str:
         """Convert non-Latin scripts to Latin"""
         if not text:
             return ""
+        # Already-ASCII names dominate the OFAC/UN lists; skip the
+        # pure-Python unidecode walk for them
+        if text.isascii():
+            return text
         return unidecode(text)
-    
+
     def normalize_arabic_names(self, text: str) -> str:
         """Normalize common Arabic name patterns"""
         # Handle Al- prefix variations
-        text = re.sub(r'\bal[\s\-]', 'al ', text)
-        
-        # Handle common transliteration variations
-        for standard, variants in self.replacements.items():
-            for variant in variants:
-                text = re.sub(rf'\b{variant}\b', standard, text)
-                
+        text = _AL_PREFIX_RE.sub('al ', text)
+
+        # Handle common transliteration variations in one scan
+        text = _VARIANTS_RE.sub(lambda m: _VARIANT_TO_STANDARD[m.group(1)], text)
+
         return text
-    
+
     def normalize_spacing(self, text: str) -> str:
         """Standardize spacing around hyphens and apostrophes"""
         # Remove spaces around hyphens
-        text = re.sub(r'\s*-\s*', '-', text)
-        
+        text = _HYPHEN_RE.sub('-', text)
+
         # Remove spaces around apostrophes
-        text = re.sub(r"\s*'\s*", "'", text)
-        
+        text = _APOS_RE.sub("'", text)
+
         return text
-    
+
     def normalize(self, text: str) -> str:
         """Full normalization pipeline"""
         if not text:
             return ""
-            
+
         # Transliterate first
         text = self.transliterate(text)
-        
+
         # Normalize Arabic patterns
         text = self.normalize_arabic_names(text)
-        
+
         # Fix spacing
         text = self.normalize_spacing(text)
-        
-        return text
\ No newline at end of file
+
+        return text
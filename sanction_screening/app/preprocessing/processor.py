@@ -1,20 +1,32 @@
 """Main preprocessing pipeline"""
 import pandas as pd
+from collections import OrderedDict, defaultdict
 from typing import Dict, List
 from .cleaner import TextCleaner
 from .normalizer import NameNormalizer
 from .tokenizer import NameTokenizer
 
+# Upper bound on memoized names: roughly a full sanctions list plus
+# recent queries
+_CACHE_MAX = 131_072
+
 class NameProcessor:
     """Complete name preprocessing pipeline"""
-    
+
     def __init__(self):
         self.cleaner = TextCleaner()
         self.normalizer = NameNormalizer()
         self.tokenizer = NameTokenizer()
-        
+        # Raw name -> processed dict, LRU-bounded; repeated names (list
+        # refreshes, recurring queries) skip the full pipeline
+        self._processed_cache = OrderedDict()
+
     def process_single(self, name: str) -> Dict[str, any]:
-        """Process a single name through full pipeline"""
+        """Process a single name through full pipeline
+
+        Results are memoized per name; callers share the cached dict
+        and must treat it as read-only.
+        """
         if not name:
             return {
                 'original': '',
@@ -23,55 +35,69 @@ class NameProcessor:
                 'tokens': [],
                 'variants': set()
             }
-            
-        # Step 1: Clean
+
+        cache = self._processed_cache
+        cached = cache.get(name)
+        if cached is not None:
+            cache.move_to_end(name)
+            return cached
+
+        # Step 1: Clean (titles and stop words filtered in one pass)
         cleaned = self.cleaner.clean(name)
-        cleaned = self.cleaner.remove_titles(cleaned)
-        cleaned = self.cleaner.remove_common_words(cleaned)
-        
+        cleaned = self.cleaner.remove_noise_words(cleaned)
+
         # Step 2: Normalize
         normalized = self.normalizer.normalize(cleaned)
-        
+
         # Step 3: Tokenize
         tokens = self.tokenizer.tokenize(normalized)
         variants = self.tokenizer.get_all_variants(normalized)
-        
-        return {
+
+        result = {
             'original': name,
             'cleaned': cleaned,
             'normalized': normalized,
             'tokens': tokens,
             'variants': variants
         }
+        cache[name] = result
+        if len(cache) > _CACHE_MAX:
+            cache.popitem(last=False)
+        return result
     
     def process_dataframe(self, df: pd.DataFrame, name_column: str = 'name') -> pd.DataFrame:
         """Process entire DataFrame of names"""
         if name_column not in df.columns:
             raise ValueError(f"Column '{name_column}' not found in DataFrame")
             
-        processed_data = []
-        
-        for _, row in df.iterrows():
-            name = row[name_column]
-            processed = self.process_single(name)
-            
-            # Combine original row data with processed data
-            result = row.to_dict()
-            result.update(processed)
-            processed_data.append(result)
-            
-        return pd.DataFrame(processed_data)
+        # Column-wise instead of iterrows: pull the names out as a plain
+        # list and process them in one pass; process_single memoizes, so
+        # repeated names and list refreshes skip the pipeline
+        names = df[name_column].tolist()
+        processed_records = [self.process_single(name) for name in names]
+
+        # Glue the processed columns onto the original frame; processed
+        # values win on column-name collisions, matching the old
+        # row-dict update semantics
+        base = df.reset_index(drop=True)
+        processed_df = pd.DataFrame(processed_records)
+        overlap = base.columns.intersection(processed_df.columns)
+        if len(overlap):
+            base = base.drop(columns=overlap)
+
+        return pd.concat([base, processed_df], axis=1)
     
     def create_search_index(self, df: pd.DataFrame) -> Dict[str, List[int]]:
         """Create search index for fast lookups"""
-        index = {}
-        
-        for idx, row in df.iterrows():
-            variants = row.get('variants', set())
-            
-            for variant in variants:
-                if variant not in index:
-                    index[variant] = []
+        if 'variants' not in df.columns:
+            return {}
+
+        # Only the variants column is read, so walk it directly instead
+        # of materializing a Series per row with iterrows; defaultdict
+        # drops the membership test per variant
+        index = defaultdict(list)
+        for idx, variants in zip(df.index, df['variants']):
+            for variant in variants or ():
                 index[variant].append(idx)
-                
-        return index
\ No newline at end of file
+
+        return dict(index)
\ No newline at end of file
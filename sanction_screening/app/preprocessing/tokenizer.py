@@ -1,28 +1,27 @@
 """Name tokenization for matching"""
+import re
+import sys
 from typing import List, Set
 
+# One scan splits on whitespace and hyphens together
+_SPLIT_RE = re.compile(r'[\s\-]+')
+
 class NameTokenizer:
     """Break names into searchable tokens"""
-    
+
     def __init__(self):
         self.min_token_length = 2
-        
+
     def tokenize(self, text: str) -> List[str]:
         """Split name into individual tokens"""
         if not text:
             return []
-            
-        # Split on whitespace and hyphens
-        tokens = []
-        for part in text.split():
-            # Split hyphenated names
-            sub_tokens = part.split('-')
-            tokens.extend(sub_tokens)
-            
-        # Filter short tokens
-        tokens = [t for t in tokens if len(t) >= self.min_token_length]
-        
-        return tokens
+
+        # Split on whitespace and hyphens, dropping short tokens
+        return [
+            t for t in _SPLIT_RE.split(text)
+            if len(t) >= self.min_token_length
+        ]
     
     def generate_ngrams(self, tokens: List[str], n: int = 2) -> List[str]:
         """Generate n-grams for partial matching"""
@@ -51,8 +50,11 @@ class NameTokenizer:
         if len(tokens) > 1:
             bigrams = self.generate_ngrams(tokens, 2)
             variants.update(bigrams)
-            
+
         # Remove empty strings
         variants.discard('')
-        
-        return variants
\ No newline at end of file
+
+        # Intern the variants: the same tokens and n-grams recur across
+        # thousands of names, so duplicates share one string object and
+        # index lookups short-circuit on identity
+        return {sys.intern(v) for v in variants}
\ No newline at end of file
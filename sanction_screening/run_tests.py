@@ -39,10 +39,12 @@ def run_all_tests():
         print("\n🔄 Testing End-to-End Integration...")
         from tests.test_end_to_end import (
             test_full_screening_pipeline,
-            test_decision_logic
+            test_decision_logic,
+            test_rule_decisions_validate
         )
         test_full_screening_pipeline()
         test_decision_logic()
+        test_rule_decisions_validate()
         
         print("\n" + "=" * 50)
         print("🎉 ALL TESTS PASSED! 🎉")
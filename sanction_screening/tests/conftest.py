@@ -0,0 +1,11 @@
+"""Shared pytest setup for the test suite
+
+Puts the project root on sys.path once so the test modules can import
+the app package without each repeating a sys.path.append side effect.
+"""
+import os
+import sys
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
@@ -1,4 +1,6 @@
 """Sample test data for SLST testing"""
+import functools
+
 import pandas as pd
 
 def create_sample_sanctions_data():
@@ -38,6 +40,17 @@ def create_sample_sanctions_data():
     
     return pd.DataFrame(sample_data)
 
+@functools.lru_cache(maxsize=1)
+def create_prepared_sanctions_data():
+    """Sample sanctions data run through preprocessing, built once
+
+    Preprocessing is the slowest setup step in the suite; test modules
+    that screen against the sample frame share this cached copy
+    instead of each reprocessing it. Treat the frame as read-only.
+    """
+    from app.preprocessing.processor import NameProcessor
+    return NameProcessor().process_dataframe(create_sample_sanctions_data())
+
 def get_test_queries():
     """Get test query names with expected results"""
     return [
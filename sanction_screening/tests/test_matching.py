@@ -1,13 +1,8 @@
 """Test matching engine components"""
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from app.matching.similarity import SimilarityCalculator
 from app.matching.matchers import ExactMatcher, FuzzyMatcher
 from app.matching.engine import MatchingEngine
-from app.preprocessing.processor import NameProcessor
-from .test_data import create_sample_sanctions_data
+from .test_data import create_prepared_sanctions_data
 
 def test_similarity_calculator():
     """Test similarity algorithms"""
@@ -61,12 +56,10 @@ def test_fuzzy_matcher():
 def test_matching_engine():
     """Test complete matching engine"""
     engine = MatchingEngine()
-    processor = NameProcessor()
-    
-    # Create and preprocess sample data
-    sanctions_df = create_sample_sanctions_data()
-    sanctions_df = processor.process_dataframe(sanctions_df)
-    
+
+    # Preprocessed sample data, shared with the other test modules
+    sanctions_df = create_prepared_sanctions_data()
+
     # Test exact match
     result = engine.screen_name("Osama bin Laden", sanctions_df)
     assert len(result['matches']) > 0, "Should find matches for Osama bin Laden"
@@ -1,8 +1,4 @@
 """Test preprocessing components"""
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from app.preprocessing.cleaner import TextCleaner
 from app.preprocessing.normalizer import NameNormalizer
 from app.preprocessing.processor import NameProcessor